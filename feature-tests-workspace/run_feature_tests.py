@@ -7,21 +7,31 @@ Plugins should exit gracefully via ClosePlugin, so timeouts are treated as failu
 """
 
 import argparse
-import re
-import shlex
+import functools
+import hashlib
+import json
+import mmap
+import os
 import subprocess
 import sys
-import signal
-import time
+import tomllib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 try:
     import colorama
+except ImportError:
+    colorama = None
+
+if colorama is not None and sys.stdout.isatty():
     from colorama import Fore, Style
     colorama.init()
-except ImportError:
-    # Fallback if colorama not available
+else:
+    # Plain output when colorama is unavailable or stdout is a pipe (CI):
+    # skipping colorama.init() avoids its per-write stdout wrapper, and the
+    # logs stay free of escape codes
     class Fore:
         RED = ""
         GREEN = ""
@@ -40,6 +50,7 @@ def show_usage() -> None:
     print("Options:")
     print("  [plugin-name...]  Run tests only for specified plugins")
     print("  --coverage        Enable coverage collection during tests")
+    print("  --jobs N          Number of plugins to test concurrently (default: cores - 2)")
     print("  -h, --help        Show this help message")
     print("")
     print("Examples:")
@@ -56,6 +67,115 @@ def show_usage() -> None:
         print(f"  - {plugin}")
 
 
+# Everything the test pipeline needs to know about one plugin, gathered in a
+# single workspace scan; bin_path is filled in once the plugin has been built
+PluginInfo = namedtuple("PluginInfo", "name path has_mock bin_path package")
+
+
+def _plugins_from_cargo_metadata() -> Optional[List[Tuple[str, Path, Optional[str], Path]]]:
+    """
+    Discover plugin crates from cargo's view of the workspace.
+
+    One cargo metadata call yields the authoritative member list along with
+    each package's name and bin source path, so no per-directory filesystem
+    probing or Cargo.toml parsing is needed afterwards.
+
+    Returns:
+        List of (plugin_name, plugin_dir, package_name, main_rs_path), or
+        None if cargo metadata is unavailable
+    """
+    try:
+        result = subprocess.run(
+            ["cargo", "metadata", "--no-deps", "--format-version=1"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    if result.returncode != 0:
+        return None
+
+    try:
+        metadata = json.loads(result.stdout)
+    except json.JSONDecodeError:
+        return None
+
+    candidates = []
+    for package in metadata.get("packages", []):
+        main_rs = None
+        for target in package.get("targets", []):
+            if "bin" in target.get("kind", []):
+                main_rs = Path(target["src_path"])
+                break
+        if main_rs is None:
+            continue  # Not a plugin crate
+
+        plugin_dir = Path(package["manifest_path"]).parent
+        candidates.append((
+            plugin_dir.name,
+            Path(os.path.relpath(plugin_dir)),
+            package["name"],
+            main_rs,
+        ))
+
+    return candidates
+
+
+def _plugins_from_directory_scan() -> List[Tuple[str, Path, Optional[str], Path]]:
+    """
+    Discover plugin crates by scanning the workspace directory.
+
+    Fallback for when cargo metadata cannot run. DirEntry.is_dir() reuses the
+    type reported by readdir, so the only stat per candidate is the
+    Cargo.toml check; dotdirs and target/ are skipped by name before even
+    that.
+
+    Returns:
+        List of (plugin_name, plugin_dir, package_name, main_rs_path)
+    """
+    candidates = []
+    with os.scandir(".") as it:
+        for entry in it:
+            if (entry.name[0] == "."
+                    or entry.name == "target"
+                    or not entry.is_dir(follow_symlinks=False)
+                    or not os.path.isfile(os.path.join(entry.path, "Cargo.toml"))):
+                continue
+            path = Path(entry.path)
+            candidates.append((
+                entry.name,
+                path,
+                get_package_name(path),
+                path / "src" / "main.rs",
+            ))
+    return candidates
+
+
+@functools.lru_cache(maxsize=1)
+def scan_plugins() -> List[PluginInfo]:
+    """
+    Scan the workspace once, gathering per-plugin metadata for all stages.
+
+    Returns:
+        One PluginInfo per plugin directory
+    """
+    candidates = _plugins_from_cargo_metadata()
+    if candidates is None:
+        candidates = _plugins_from_directory_scan()
+
+    # The mock probes are independent small file reads, so overlap their I/O
+    # in threads instead of paying each open+read latency in sequence
+    with ThreadPoolExecutor(max_workers=min(32, max(len(candidates), 1))) as executor:
+        mock_flags = executor.map(
+            has_mock_support, (main_rs for _, _, _, main_rs in candidates))
+
+    return [
+        PluginInfo(name, path, has_mock, None, package)
+        for (name, path, package, _), has_mock in zip(candidates, mock_flags)
+    ]
+
+
 def find_available_plugins() -> List[str]:
     """
     Find all available feature test plugin directories.
@@ -63,14 +183,7 @@ def find_available_plugins() -> List[str]:
     Returns:
         List of plugin directory names
     """
-    current_dir = Path.cwd()
-    plugins = []
-
-    for plugin_dir in current_dir.iterdir():
-        if plugin_dir.is_dir() and (plugin_dir / "Cargo.toml").exists():
-            plugins.append(plugin_dir.name)
-
-    return plugins
+    return [plugin.name for plugin in scan_plugins()]
 
 
 def setup_coverage_env() -> Optional[Dict[str, str]]:
@@ -91,34 +204,37 @@ def setup_coverage_env() -> Optional[Dict[str, str]]:
         if result.returncode != 0:
             return None
             
-        # Parse the output to extract environment variables
+        # Parse the output to extract environment variables. The format is
+        # predictable (`export KEY="value"` per line), so a single partition
+        # per line beats the regex + shlex machinery this used to run.
         env_vars = {}
-        export_pattern = re.compile(r'^export\s+([^=]+)=(.*)$')
-        
-        for line in result.stdout.strip().split('\n'):
+
+        for line in result.stdout.splitlines():
             line = line.strip()
-            if not line:
+            if not line.startswith("export "):
                 continue
-                
-            match = export_pattern.match(line)
-            if match:
-                key = match.group(1).strip()
-                value_part = match.group(2)
-                
-                # Use shlex to properly parse the value, handling quotes and escapes
-                try:
-                    # shlex.split handles proper shell quoting
-                    parsed_values = shlex.split(value_part)
-                    if parsed_values:
-                        # For environment variables, we expect a single value
-                        env_vars[key] = parsed_values[0]
-                except ValueError:
-                    # If shlex fails to parse, fall back to the raw value
-                    # This handles edge cases where the value might not be properly quoted
-                    env_vars[key] = value_part
-        
+
+            key, sep, value = line[len("export "):].partition("=")
+            if not sep:
+                continue
+
+            env_vars[key.strip()] = value.strip().strip('"').strip("'")
+
+        # Share one instrumented target directory across every plugin, and
+        # point plain `cargo build` at it too, so instrumented builds of the
+        # shared dependencies are reused between plugins instead of being
+        # recompiled per plugin. An explicit CARGO_LLVM_COV_TARGET_DIR in the
+        # caller's environment (e.g. a CI cache location) wins over the
+        # computed default.
+        target_dir = env_vars.setdefault(
+            "CARGO_LLVM_COV_TARGET_DIR",
+            os.environ.get("CARGO_LLVM_COV_TARGET_DIR")
+            or str(Path.cwd() / "target" / "llvm-cov-target"),
+        )
+        env_vars["CARGO_TARGET_DIR"] = target_dir
+
         return env_vars
-        
+
     except (subprocess.CalledProcessError, FileNotFoundError):
         return None
 
@@ -126,7 +242,7 @@ def setup_coverage_env() -> Optional[Dict[str, str]]:
 def clean_coverage_workspace() -> bool:
     """
     Clean the workspace for coverage collection.
-    
+
     Returns:
         True if successful, False otherwise
     """
@@ -141,69 +257,307 @@ def clean_coverage_workspace() -> bool:
         return False
 
 
-def generate_coverage_report_for_plugin(plugin_name: str, coverage_env: Optional[dict] = None) -> bool:
+def remove_stale_profraws(target_dir: Path) -> None:
+    """
+    Delete leftover .profraw files from earlier runs.
+
+    Skipping the full clean keeps the instrumented build artifacts, but
+    profile data from a previous run must not survive into this one: the
+    reports merge every profraw in the target dir, so stale ones would mark
+    lines as covered that the current run never exercised.
+
+    Args:
+        target_dir: The shared coverage target directory
+    """
+    for profraw in target_dir.rglob("*.profraw"):
+        try:
+            profraw.unlink()
+        except OSError:
+            pass  # Best effort; a vanished file is already what we want
+
+
+def ensure_clean_coverage_workspace(coverage_env: Dict[str, str]) -> bool:
+    """
+    Clean the coverage workspace, but only when the dependency graph changed.
+
+    Cleaning discards all instrumented build artifacts, which forces a full
+    recompile of every plugin and its dependencies. The artifacts only go
+    stale when the dependency graph changes, so we remember a hash of
+    Cargo.lock in the coverage target directory and skip the clean while it
+    still matches.
+
+    Args:
+        coverage_env: Environment variables from setup_coverage_env
+
+    Returns:
+        True if the workspace is ready for coverage collection
+    """
+    target_dir = Path(coverage_env["CARGO_TARGET_DIR"])
+    stamp_path = target_dir / ".cargo-lock-hash"
+
+    try:
+        lock_hash = hashlib.sha256(Path("Cargo.lock").read_bytes()).hexdigest()
+    except OSError:
+        lock_hash = None
+
+    if lock_hash is not None:
+        try:
+            if stamp_path.read_text() == lock_hash:
+                # Reusing the build artifacts is safe, but the previous
+                # run's profile data is not
+                remove_stale_profraws(target_dir)
+                return True
+        except OSError:
+            pass  # No stamp yet; fall through to a clean
+
+    if not clean_coverage_workspace():
+        return False
+
+    if lock_hash is not None:
+        try:
+            target_dir.mkdir(parents=True, exist_ok=True)
+            stamp_path.write_text(lock_hash)
+        except OSError:
+            pass  # Worst case we clean again next run
+
+    return True
+
+
+def generate_coverage_report_for_plugin(plugin_name: str, env: Dict[str, str], output_root: Path) -> bool:
     """
     Generate coverage report for a specific plugin.
-    
+
     Args:
         plugin_name: Name of the plugin to generate coverage for
-        coverage_env: Environment variables for coverage
-        
+        env: Environment for the cargo subprocess, including the coverage
+            variables; built once by the caller since it is the same for
+            every plugin
+        output_root: Directory the .lcov file is written to (absolute, so
+            the output location doesn't depend on the subprocess cwd)
+
     Returns:
         True if successful, False otherwise
     """
     plugin_dir = Path(plugin_name)
-    output_path = f"coverage-{plugin_name}.lcov"
-    
+    output_path = str(output_root / f"coverage-{plugin_name}.lcov")
+
     try:
-        original_dir = Path.cwd()
-        import os
-        os.chdir(plugin_dir)
-        
-        # Prepare environment
-        env = dict(os.environ)
-        if coverage_env:
-            env.update(coverage_env)
-        
         result = subprocess.run(
-            ["cargo", "llvm-cov", "report", "--lcov", "--output-path", f"../{output_path}"],
+            ["cargo", "llvm-cov", "report", "--lcov", "--output-path", output_path],
             capture_output=True,
             text=True,
             env=env,
+            cwd=plugin_dir,
         )
-        
-        os.chdir(original_dir)
-        
+
         return result.returncode == 0
-        
+
     except (subprocess.CalledProcessError, FileNotFoundError, OSError):
         return False
 
 
-def has_mock_support(plugin_dir: Path) -> bool:
+def has_mock_support(main_rs_path: Path) -> bool:
     """
     Check if plugin has mock support by looking for mock server usage in main.rs.
 
     Args:
-        plugin_dir: Path to the plugin directory
+        main_rs_path: Path to the plugin's main.rs
 
     Returns:
         True if plugin has mock support
     """
-    main_rs_path = plugin_dir / "src" / "main.rs"
-
-    if not main_rs_path.exists():
+    try:
+        # Search the raw bytes via mmap rather than decoding the whole file
+        # into a str; the needle is plain ASCII so no decode is needed
+        with open(main_rs_path, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return mm.find(b"MockTouchPortalServer") != -1
+            except ValueError:
+                # Empty files cannot be mmapped, and cannot contain the needle
+                return False
+    except OSError:
         return False
 
+
+def get_package_name(plugin_dir: Path) -> Optional[str]:
+    """
+    Read the cargo package name of a plugin directory.
+
+    Args:
+        plugin_dir: Path to the plugin directory
+
+    Returns:
+        The package name, or None if Cargo.toml is missing or malformed
+    """
+    try:
+        # read_text does the open/read/close dance in one call
+        return tomllib.loads(
+            (plugin_dir / "Cargo.toml").read_text())["package"]["name"]
+    except (OSError, KeyError, tomllib.TOMLDecodeError):
+        return None
+
+
+def batch_build_plugins(plugins: List[PluginInfo], env: Dict[str, str]) -> Optional[Dict[str, str]]:
+    """
+    Build all given plugins with a single cargo invocation.
+
+    The plugins share one workspace, so building them together amortizes
+    cargo's manifest parsing and dependency resolution across all of them
+    instead of paying it once per plugin.
+
+    Args:
+        plugins: Plugins to build
+        env: Environment for the cargo subprocess
+
+    Returns:
+        Mapping of plugin directory name to built binary path, or None if
+        the batch build failed (callers should fall back to per-plugin builds)
+    """
+    packages = {}
+    for plugin in plugins:
+        if plugin.package is None:
+            return None
+        packages[plugin.package] = plugin.name
+
+    build_cmd = ["cargo", "build", "--quiet", "--message-format=json-render-diagnostics"]
+    for package_name in packages:
+        build_cmd += ["-p", package_name]
+
     try:
-        with open(main_rs_path, 'r') as f:
-            content = f.read()
-        return "MockTouchPortalServer" in content
-    except IOError:
-        return False
+        # stderr is compile progress we never show; the fallback per-plugin
+        # builds report diagnostics if this fails
+        result = subprocess.run(
+            build_cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            env=env,
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+
+    if result.returncode != 0:
+        return None
+
+    executables = {}
+    for line in result.stdout.splitlines():
+        if not line:
+            continue
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            continue  # Skip non-JSON lines
 
+        # The bin target of each plugin carries the package name
+        if (message.get("reason") == "compiler-artifact" and
+            message.get("target", {}).get("kind") == ["bin"] and
+            message.get("executable") and
+            message["target"].get("name") in packages):
+            executables[packages[message["target"]["name"]]] = message["executable"]
 
-def run_plugin_test(plugin_dir: Path, timeout_seconds: int = 30, enable_coverage: bool = False, coverage_env: Optional[dict] = None) -> Tuple[bool, str]:
+    return executables
+
+
+def get_file_mtime(file_path: Path) -> float:
+    """
+    Get modification time of a file, returning 0 if it doesn't exist.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Unix timestamp or 0 if the file doesn't exist
+    """
+    try:
+        return file_path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def newest_source_mtime(root: Path) -> float:
+    """
+    Newest modification time of any file under root, skipping target/ and
+    hidden directories.
+
+    Args:
+        root: Directory to walk
+
+    Returns:
+        Unix timestamp of the newest file, or 0 if none were found
+    """
+    newest = 0.0
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d != "target" and not d.startswith(".")]
+        for name in filenames:
+            try:
+                mtime = os.stat(os.path.join(dirpath, name)).st_mtime
+            except OSError:
+                continue
+            if mtime > newest:
+                newest = mtime
+    return newest
+
+
+def find_fresh_executable(plugin: PluginInfo, target_dir: str, shared_mtime: float) -> Optional[str]:
+    """
+    Find an already-built binary for the plugin that is newer than all of its
+    inputs, make-style, so cargo doesn't have to be spawned at all.
+
+    Args:
+        plugin: The plugin to look up
+        target_dir: The cargo target directory the binary would live in
+        shared_mtime: Newest mtime among inputs shared by all plugins (the
+            SDK sources and the workspace manifests)
+
+    Returns:
+        Path to the up-to-date binary, or None if cargo needs to run
+    """
+    if plugin.package is None:
+        return None
+
+    # The bin target of each plugin is named after its package. Resolve to
+    # an absolute path: the binary is executed with cwd=plugin_dir, where a
+    # relative target/ path would point at the wrong directory.
+    bin_path = Path(target_dir).resolve() / "debug" / plugin.package
+    try:
+        bin_mtime = bin_path.stat().st_mtime
+    except OSError:
+        return None
+
+    if max(newest_source_mtime(plugin.path), shared_mtime) >= bin_mtime:
+        return None
+
+    return str(bin_path)
+
+
+def find_plugin_executable(build_output: str) -> Optional[str]:
+    """
+    Extract the plugin binary path from cargo's JSON build messages.
+
+    Args:
+        build_output: stdout of a `cargo build --message-format=json-render-diagnostics` run
+
+    Returns:
+        Path to the built binary, or None if no binary artifact was reported
+    """
+    for line in build_output.splitlines():
+        if not line:
+            continue
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            continue  # Skip non-JSON lines
+
+        if (message.get("reason") == "compiler-artifact" and
+            message.get("target", {}).get("kind") == ["bin"] and
+            message.get("executable")):
+            return message["executable"]
+
+    return None
+
+
+def run_plugin_test(plugin_dir: Path, timeout_seconds: int = 30, enable_coverage: bool = False, coverage_env: Optional[dict] = None, prebuilt_executable: Optional[str] = None) -> Tuple[bool, str]:
     """
     Run a single plugin test.
 
@@ -212,59 +566,80 @@ def run_plugin_test(plugin_dir: Path, timeout_seconds: int = 30, enable_coverage
         timeout_seconds: Timeout in seconds (applies only to execution, not build)
         enable_coverage: Whether to collect coverage data
         coverage_env: Environment variables for coverage (from cargo llvm-cov show-env)
+        prebuilt_executable: Path to an already-built plugin binary; when given,
+            the build step is skipped entirely
 
     Returns:
         Tuple of (success, status_message)
     """
-    original_dir = Path.cwd()
-
-    try:
-        # Change to plugin directory
-        import os
-        os.chdir(plugin_dir)
-
-        # Prepare environment - use coverage env if provided, otherwise use current env
-        env = dict(os.environ)
-        if enable_coverage and coverage_env:
-            env.update(coverage_env)
+    # Prepare environment - use coverage env if provided, otherwise use current env
+    env = dict(os.environ)
+    if enable_coverage and coverage_env:
+        env.update(coverage_env)
 
-        # Step 1: Build the plugin first (without timeout to handle dependency compilation)
-        build_cmd = ["cargo", "build", "--quiet"]
+    if prebuilt_executable:
+        executable = prebuilt_executable
+    else:
+        # Step 1: Build the plugin first (without timeout to handle dependency
+        # compilation). Ask cargo for JSON messages so we learn the path of the
+        # produced binary and can execute it directly instead of paying for a
+        # second cargo invocation.
+        build_cmd = ["cargo", "build", "--quiet", "--message-format=json-render-diagnostics"]
 
         try:
+            # Discard stderr (compile progress) on the happy path rather than
+            # buffering and decoding it just to throw it away; stdout carries
+            # the JSON messages we need
             build_result = subprocess.run(
                 build_cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
                 env=env,
+                cwd=plugin_dir,
             )
 
             if build_result.returncode != 0:
-                return False, f"{Fore.RED}FAILED{Style.RESET_ALL} (build failed: {build_result.stderr.strip()})"
+                # Re-run once to produce a human-readable diagnostic; the
+                # failed build is cached, so this only replays the errors
+                diagnostic = subprocess.run(
+                    ["cargo", "build", "--quiet"],
+                    capture_output=True,
+                    text=True,
+                    env=env,
+                    cwd=plugin_dir,
+                )
+                return False, f"{Fore.RED}FAILED{Style.RESET_ALL} (build failed: {diagnostic.stderr.strip()})"
 
         except subprocess.CalledProcessError as e:
             return False, f"{Fore.RED}FAILED{Style.RESET_ALL} (build command failed: {e})"
 
-        # Step 2: Run the plugin with timeout (now that it's built)
-        run_cmd = ["cargo", "run", "--quiet"]
+        executable = find_plugin_executable(build_result.stdout)
 
+    # Step 2: Run the plugin with timeout (now that it's built).
+    # Fall back to `cargo run` if the artifact message was missing for some
+    # reason (e.g., a future cargo changes its JSON output), or if the
+    # binary path turns out to be stale; a dangling path must fail this one
+    # test, never crash the whole runner.
+    run_cmds = [[executable]] if executable else []
+    run_cmds.append(["cargo", "run", "--quiet"])
+
+    for run_cmd in run_cmds:
         try:
+            # Only the exit code matters here (the plugin logs via tracing
+            # when debugging is wanted), so route the output to /dev/null
+            # rather than accumulating it in pipes just to drop it
             result = subprocess.run(
                 run_cmd,
                 timeout=timeout_seconds,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 env=env,
+                cwd=plugin_dir,
             )
 
-            # If process completed within timeout, it should have exited successfully (code 0)
-            if result.returncode == 0:
-                if enable_coverage:
-                    return True, f"{Fore.GREEN}PASSED{Style.RESET_ALL} (coverage data collected)"
-                else:
-                    return True, f"{Fore.GREEN}PASSED{Style.RESET_ALL}"
-            else:
-                return False, f"{Fore.RED}FAILED{Style.RESET_ALL} (exit code {result.returncode})"
+        except OSError:
+            continue  # Couldn't exec this command; try the next candidate
 
         except subprocess.TimeoutExpired:
             # Timeout is a failure as plugins should exit gracefully
@@ -273,10 +648,16 @@ def run_plugin_test(plugin_dir: Path, timeout_seconds: int = 30, enable_coverage
         except subprocess.CalledProcessError as e:
             return False, f"{Fore.RED}FAILED{Style.RESET_ALL} (execution failed: {e})"
 
-    finally:
-        # Always change back to original directory
-        import os
-        os.chdir(original_dir)
+        # If process completed within timeout, it should have exited successfully (code 0)
+        if result.returncode == 0:
+            if enable_coverage:
+                return True, f"{Fore.GREEN}PASSED{Style.RESET_ALL} (coverage data collected)"
+            else:
+                return True, f"{Fore.GREEN}PASSED{Style.RESET_ALL}"
+        else:
+            return False, f"{Fore.RED}FAILED{Style.RESET_ALL} (exit code {result.returncode})"
+
+    return False, f"{Fore.RED}FAILED{Style.RESET_ALL} (could not execute plugin binary)"
 
 
 def main() -> None:
@@ -301,6 +682,12 @@ def main() -> None:
         action="store_true",
         help="Enable coverage collection during tests",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of plugins to test concurrently (default: cores - 2)",
+    )
 
     args = parser.parse_args()
 
@@ -309,14 +696,10 @@ def main() -> None:
         return
 
     # Validate requested plugins if any were provided
-    available_plugins = find_available_plugins()
+    available_plugins = {plugin.name: plugin for plugin in scan_plugins()}
 
     if args.plugins:
-        unknown_plugins = []
-        for plugin in args.plugins:
-            plugin_dir = Path(plugin)
-            if not plugin_dir.is_dir() or not (plugin_dir / "Cargo.toml").exists():
-                unknown_plugins.append(plugin)
+        unknown_plugins = [name for name in args.plugins if name not in available_plugins]
 
         if unknown_plugins:
             print(f"{Fore.RED}Error: Unknown plugin names: {', '.join(unknown_plugins)}{Style.RESET_ALL}")
@@ -324,12 +707,16 @@ def main() -> None:
             show_usage()
             sys.exit(1)
 
-        plugins_to_test = args.plugins
+        plugins_to_test = [available_plugins[name] for name in args.plugins]
     else:
-        plugins_to_test = available_plugins
+        plugins_to_test = list(available_plugins.values())
 
-    print("🧪 TouchPortal Plugin Feature Tests")
-    print("==================================")
+    # One write per block: fewer stdout round-trips, and blocks can't be
+    # split by concurrently completing test results
+    sys.stdout.write(
+        "🧪 TouchPortal Plugin Feature Tests\n"
+        "==================================\n"
+    )
 
     # Set up coverage environment if needed
     coverage_env = None
@@ -340,55 +727,120 @@ def main() -> None:
             print(f"{Fore.RED}FAILED{Style.RESET_ALL} (could not set up coverage environment)")
             sys.exit(1)
         
-        # Clean workspace for accurate coverage
-        if not clean_coverage_workspace():
+        # Clean workspace for accurate coverage (skipped when the previous
+        # run's instrumented artifacts are still valid)
+        if not ensure_clean_coverage_workspace(coverage_env):
             print(f"{Fore.RED}FAILED{Style.RESET_ALL} (could not clean coverage workspace)")
             sys.exit(1)
             
         print(f"{Fore.GREEN}DONE{Style.RESET_ALL}")
 
     # Counters
-    total_plugins = 0
+    total_plugins = len(plugins_to_test)
     tested_plugins = 0
     skipped_plugins = 0
     failed_plugins = 0
     successfully_tested_plugins = []
 
-    for plugin_name in plugins_to_test:
-        plugin_dir = Path(plugin_name)
-        total_plugins += 1
+    # Split plugins into testable and skipped up front so the pool only
+    # receives real work
+    testable_plugins = []
+    for plugin in plugins_to_test:
+        if plugin.has_mock:
+            testable_plugins.append(plugin)
+        else:
+            # Plugin doesn't have mock support yet
+            sys.stdout.write(f"Testing {plugin.name}... {Fore.YELLOW}SKIPPED{Style.RESET_ALL} (no mock support)\n")
+            skipped_plugins += 1
 
-        print(f"Testing {plugin_name}... ", end="", flush=True)
+    # Build every testable plugin with one cargo invocation up front; they
+    # share a workspace, so this amortizes cargo's startup and resolver work.
+    # On failure the per-plugin builds below surface the diagnostics.
+    if testable_plugins:
+        build_env = dict(os.environ)
+        if args.coverage and coverage_env:
+            build_env.update(coverage_env)
+
+        # Stamp comparison first: a plugin whose binary is newer than all of
+        # its inputs doesn't need cargo at all, which matters on iterative
+        # runs where most plugins are untouched
+        target_dir = build_env.get("CARGO_TARGET_DIR", "target")
+        shared_mtime = max(
+            newest_source_mtime(Path("../sdk")),
+            get_file_mtime(Path("Cargo.toml")),
+            get_file_mtime(Path("Cargo.lock")),
+        )
 
-        # Check if plugin has mock support
-        if has_mock_support(plugin_dir):
-            # Plugin has mock support, run the test
-            success, status_message = run_plugin_test(
-                plugin_dir, 
-                enable_coverage=args.coverage,
-                coverage_env=coverage_env
-            )
-            print(status_message)
+        prebuilt = {}
+        stale_plugins = []
+        for plugin in testable_plugins:
+            executable = find_fresh_executable(plugin, target_dir, shared_mtime)
+            if executable:
+                prebuilt[plugin.name] = executable
+            else:
+                stale_plugins.append(plugin)
+
+        if stale_plugins:
+            prebuilt.update(batch_build_plugins(stale_plugins, build_env) or {})
+
+        testable_plugins = [
+            plugin._replace(bin_path=prebuilt.get(plugin.name))
+            for plugin in testable_plugins
+        ]
+
+    # The tests are independent and spend their time waiting on
+    # subprocesses, which release the GIL, so threads give the same
+    # concurrency as processes without the fork and argument-pickling
+    # overhead; leave a couple of cores free for the rest of the system
+    max_workers = args.jobs or max((os.cpu_count() or 1) - 2, 1)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                run_plugin_test,
+                plugin.path,
+                30,
+                args.coverage,
+                coverage_env,
+                plugin.bin_path,
+            ): plugin.name
+            for plugin in testable_plugins
+        }
+
+        for future in as_completed(futures):
+            plugin_name = futures[future]
+            success, status_message = future.result()
+            # One write per result; sub-PIPE_BUF writes are atomic, so
+            # completed results never interleave mid-line
+            sys.stdout.write(f"Testing {plugin_name}... {status_message}\n")
 
             if success:
                 tested_plugins += 1
                 successfully_tested_plugins.append(plugin_name)
             else:
                 failed_plugins += 1
-        else:
-            # Plugin doesn't have mock support yet
-            print(f"{Fore.YELLOW}SKIPPED{Style.RESET_ALL} (no mock support)")
-            skipped_plugins += 1
+
+    sys.stdout.flush()
 
     # Generate coverage reports if coverage was enabled and tests were successful
     if args.coverage and failed_plugins == 0 and successfully_tested_plugins:
         print("")
         print("Generating coverage reports... ", end="", flush=True)
+        # The environment and output directory are the same for every
+        # plugin, so build them once here rather than per report
+        report_env = dict(os.environ)
+        if coverage_env:
+            report_env.update(coverage_env)
+        output_root = Path.cwd().resolve()
+
+        # Each report invocation merges the shared target dir's profraws
+        # into the same profdata file, so these must run one at a time;
+        # concurrent runs race writers against readers and corrupt reports
         coverage_success = True
         for plugin_name in successfully_tested_plugins:
-            if not generate_coverage_report_for_plugin(plugin_name, coverage_env):
+            if not generate_coverage_report_for_plugin(plugin_name, report_env, output_root):
                 coverage_success = False
-        
+
         if coverage_success:
             coverage_files = [f"coverage-{plugin}.lcov" for plugin in successfully_tested_plugins]
             print(f"{Fore.GREEN}DONE{Style.RESET_ALL} (saved {', '.join(coverage_files)})")
@@ -396,19 +848,20 @@ def main() -> None:
             print(f"{Fore.RED}FAILED{Style.RESET_ALL} (coverage report generation failed)")
             failed_plugins += 1  # Treat coverage failure as a test failure
 
-    print("")
-    print("==================================")
-    print("📊 Test Summary:")
-    print(f"  Total plugins: {total_plugins}")
-    print(f"  {Fore.GREEN}Tested: {tested_plugins}{Style.RESET_ALL}")
-    print(f"  {Fore.YELLOW}Skipped: {skipped_plugins}{Style.RESET_ALL}")
-    print(f"  {Fore.RED}Failed: {failed_plugins}{Style.RESET_ALL}")
+    summary = (
+        "\n==================================\n"
+        "📊 Test Summary:\n"
+        f"  Total plugins: {total_plugins}\n"
+        f"  {Fore.GREEN}Tested: {tested_plugins}{Style.RESET_ALL}\n"
+        f"  {Fore.YELLOW}Skipped: {skipped_plugins}{Style.RESET_ALL}\n"
+        f"  {Fore.RED}Failed: {failed_plugins}{Style.RESET_ALL}\n"
+    )
 
     if failed_plugins == 0:
-        print(f"{Fore.GREEN}✅ All tests passed!{Style.RESET_ALL}")
+        sys.stdout.write(summary + f"{Fore.GREEN}✅ All tests passed!{Style.RESET_ALL}\n")
         sys.exit(0)
     else:
-        print(f"{Fore.RED}❌ Some tests failed{Style.RESET_ALL}")
+        sys.stdout.write(summary + f"{Fore.RED}❌ Some tests failed{Style.RESET_ALL}\n")
         sys.exit(1)
 
 
@@ -17,8 +17,8 @@ import os
 import shutil
 import subprocess
 import sys
-import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Import our common functions
@@ -49,6 +49,62 @@ class ZipFileWithPermissions(zipfile.ZipFile):
         return targetpath
 
 
+# Below this decompressed size, thread startup costs more than parallel
+# DEFLATE saves
+PARALLEL_EXTRACT_MIN_SIZE = 1024 * 1024
+
+
+def extract_archive(zip_ref: ZipFileWithPermissions, tpp_file: str, dest: Path) -> None:
+    """
+    Extract all members of the archive, in parallel when it is big enough.
+
+    Each member is DEFLATE-compressed independently, so workers can
+    decompress their own members concurrently as long as every worker uses
+    its own handle on the (read-only) archive.
+
+    Args:
+        zip_ref: Already-open archive (used for small archives and metadata)
+        tpp_file: Path to the archive, for the per-worker handles
+        dest: Directory to extract into
+    """
+    members = zip_ref.infolist()
+    total_size = sum(member.file_size for member in members)
+
+    if len(members) < 2 or total_size < PARALLEL_EXTRACT_MIN_SIZE:
+        zip_ref.extractall(dest)
+        return
+
+    # Pre-create all directories up front; zipfile's own directory creation
+    # is racy when two workers extract siblings concurrently
+    for member in members:
+        dirname = os.path.dirname(member.filename.rstrip('/'))
+        if member.is_dir():
+            dirname = member.filename
+        if dirname:
+            (dest / dirname).mkdir(parents=True, exist_ok=True)
+
+    file_members = [m for m in members if not m.is_dir()]
+
+    # Shard members by decompressed size so the workers finish together
+    workers = min(os.cpu_count() or 1, len(file_members))
+    shards = [[] for _ in range(workers)]
+    shard_sizes = [0] * workers
+    for member in sorted(file_members, key=lambda m: m.file_size, reverse=True):
+        smallest = shard_sizes.index(min(shard_sizes))
+        shards[smallest].append(member)
+        shard_sizes[smallest] += member.file_size
+
+    def extract_shard(shard):
+        # A second handle on the archive only re-reads the central directory
+        with ZipFileWithPermissions(tpp_file, 'r') as zf:
+            for member in shard:
+                zf.extract(member, dest)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [executor.submit(extract_shard, shard) for shard in shards]:
+            future.result()
+
+
 def ensure_plugin_packaged() -> None:
     """
     Ensure the plugin is packaged by running package.py.
@@ -81,20 +137,39 @@ def install_plugin(plugin_name: str, tpp_file: str) -> None:
     log_step("Installing plugin files")
     log_info(f"Destination: {install_dir}")
 
-    # Remove existing installation directory for clean installation
-    if install_dir.exists():
-        shutil.rmtree(install_dir)
-
-    # Create the parent directory
-    install_dir.parent.mkdir(parents=True, exist_ok=True)
+    # Extract into a staging directory next to the final location, then swap
+    # it in with rename. The existing installation stays live (and intact)
+    # until the new one has extracted completely, so a corrupt archive or a
+    # crash mid-install can't leave a half-written plugin behind.
+    staging_root = install_dir.parent / f".{plugin_name}.staging"
+    old_dir = install_dir.parent / f".{plugin_name}.old"
 
     try:
-        # Extract the .tpp file (which is a ZIP archive) directly to the plugins directory
-        with ZipFileWithPermissions(tpp_file, 'r') as zip_ref:
-            zip_ref.extractall(install_dir.parent)
+        shutil.rmtree(staging_root, ignore_errors=True)
+        staging_root.mkdir(parents=True)
 
-        # Count installed files
-        file_count = sum(1 for _ in install_dir.rglob('*') if _.is_file())
+        with ZipFileWithPermissions(tpp_file, 'r') as zip_ref:
+            # The .tpp file is a ZIP archive whose root directory is the plugin name
+            extract_archive(zip_ref, tpp_file, staging_root)
+
+        staged_dir = staging_root / plugin_name
+        if not staged_dir.is_dir():
+            log_error(f"Archive root does not match plugin name {plugin_name}")
+            sys.exit(1)
+
+        # Swap the new installation into place
+        shutil.rmtree(old_dir, ignore_errors=True)
+        if install_dir.exists():
+            os.replace(install_dir, old_dir)
+        os.replace(staged_dir, install_dir)
+
+        # The old installation can be deleted after the new one is live
+        shutil.rmtree(old_dir, ignore_errors=True)
+        shutil.rmtree(staging_root, ignore_errors=True)
+
+        # Count installed files; os.walk already knows which entries are
+        # files, so this needs no per-entry stat calls
+        file_count = sum(len(files) for _, _, files in os.walk(install_dir))
         log_info(f"Installed: {file_count} files")
 
     except zipfile.BadZipFile:
@@ -122,7 +197,7 @@ Modifies your system by copying files to ~/.config/TouchPortal/plugins/""",
 
     # First, we extract the plugin configuration from Cargo.toml metadata.
     # This gives us the plugin name and expected .tpp filename.
-    plugin_name, _, tpp_file = get_plugin_config()
+    plugin_name, _, tpp_file, _ = get_plugin_config()
 
     # Verify all required tools are available before we start the installation.
     # We don't need rsync since we use Python's built-in file operations.
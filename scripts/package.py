@@ -12,16 +12,28 @@ The script is designed to be efficient by only rebuilding when source files chan
 """
 
 import argparse
-import json
 import os
 import re
-import shutil
 import subprocess
 import sys
 import tempfile
 import zipfile
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Optional, Tuple
+
+try:
+    # orjson decodes cargo's JSON streams several times faster than the
+    # stdlib; fall back when it isn't installed
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # ijson lets validation pull just the plugin_start_cmd keys out of
+    # entry.tp without materializing the whole plugin definition
+    import ijson
+except ImportError:
+    ijson = None
 
 # Import our common functions
 from plugin_common import (
@@ -30,28 +42,43 @@ from plugin_common import (
     log_step,
     log_info,
     log_error,
-    log_success,
 )
 
 
-def get_newest_source_time() -> float:
+# Directories that never contain plugin sources; target/ in particular is
+# huge and dominates a naive recursive walk
+SKIP_DIRS = {"target", ".git", "node_modules", ".venv"}
+
+# Expected shape of every plugin_start_cmd path, compiled once up front
+_START_CMD_RE = re.compile(r"^%TP_PLUGIN_FOLDER%([^/]+)/(.+)$")
+
+
+def is_any_source_newer(threshold: float, root: str = ".") -> bool:
     """
-    Get the modification time of the newest source file.
+    Check whether any source file was modified after the given time.
+
+    The rebuild decision only needs "is something newer than the package",
+    not the actual newest timestamp, so the walk stops at the first hit.
+
+    Args:
+        threshold: Unix timestamp to compare against (the package's mtime)
+        root: Directory to scan from
 
     Returns:
-        Unix timestamp of the newest source file, or 0 if no files found
+        True if any source file is newer than threshold
     """
-    source_patterns = ["*.rs", "Cargo.toml", "build.rs"]
-    newest_time = 0
-
-    for pattern in source_patterns:
-        for file_path in Path(".").glob(f"**/{pattern}"):
-            if file_path.is_file():
-                mtime = file_path.stat().st_mtime
-                if mtime > newest_time:
-                    newest_time = mtime
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS and is_any_source_newer(threshold, entry.path):
+                    return True
+            elif entry.is_file(follow_symlinks=False):
+                if entry.name.endswith(".rs") or entry.name in ("Cargo.toml", "build.rs"):
+                    # scandir caches the stat result from the directory read
+                    if entry.stat().st_mtime > threshold:
+                        return True
 
-    return newest_time
+    return False
 
 
 def get_file_mtime(file_path: Path) -> float:
@@ -70,12 +97,13 @@ def get_file_mtime(file_path: Path) -> float:
         return 0
 
 
-def build_plugin(crate_binary: str) -> Tuple[str, str]:
+def build_plugin(crate_binary: str, current_package_id: str) -> Tuple[str, str]:
     """
     Build the plugin and return paths to the executable and entry.tp.
 
     Args:
         crate_binary: Name of the binary to build
+        current_package_id: Cargo package ID of the plugin crate
 
     Returns:
         Tuple of (plugin_exe_path, entry_tp_path)
@@ -85,27 +113,34 @@ def build_plugin(crate_binary: str) -> Tuple[str, str]:
     """
     log_step(f"Building plugin binary: {crate_binary}")
 
-    try:
-        # Build the plugin and capture JSON output
-        result = subprocess.run(
+    # Build the plugin, streaming the JSON messages as cargo emits them
+    # instead of buffering the whole (potentially many-MB) stream; parsing
+    # then overlaps with rustc's work. Compiler diagnostics arrive on
+    # stdout as part of the JSON stream, but cargo-level failures (manifest
+    # errors, resolution failures) only ever reach stderr, so spill that to
+    # a temp file we can read back on failure without risking a pipe
+    # deadlock while we consume stdout.
+    with tempfile.TemporaryFile() as stderr_spill:
+        proc = subprocess.Popen(
             ["cargo", "build", "--release", "--bin", crate_binary, "--message-format=json"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=stderr_spill,
             text=True,
-            check=True,
         )
 
-        # Parse the JSON output line by line
         plugin_exe = None
         out_dir = None
-        current_package_id = subprocess.run(
-            ["cargo", "pkgid"], capture_output=True, text=True, check=True
-        ).stdout.strip()
-
-        for line in result.stdout.strip().split('\n'):
-            if not line:
+        rendered_diagnostics = []
+
+        for line in proc.stdout:
+            # Cargo emits compact JSON, so a substring probe reliably rules
+            # out the vast majority of messages without paying for json.loads
+            if ('"reason":"compiler-artifact"' not in line
+                    and '"reason":"build-script-executed"' not in line
+                    and '"reason":"compiler-message"' not in line):
                 continue
             try:
-                message = json.loads(line)
+                message = json_loads(line)
 
                 # Extract executable path from compiler-artifact messages
                 if (message.get("reason") == "compiler-artifact" and
@@ -117,39 +152,56 @@ def build_plugin(crate_binary: str) -> Tuple[str, str]:
                     message.get("package_id") == current_package_id):
                     out_dir = message.get("out_dir")
 
-            except json.JSONDecodeError:
-                continue  # Skip non-JSON lines
-
-        if not plugin_exe:
-            log_error(f"Failed to find executable path for {crate_binary}")
+                # Keep rendered compiler diagnostics in case the build fails
+                if message.get("reason") == "compiler-message":
+                    rendered = message.get("message", {}).get("rendered")
+                    if rendered:
+                        rendered_diagnostics.append(rendered)
+
+            except ValueError:
+                continue  # Skip non-JSON lines (both decoders raise ValueError subclasses)
+
+        proc.stdout.close()
+        if proc.wait() != 0:
+            log_error(f"Failed to build plugin: cargo exited with status {proc.returncode}")
+            if rendered_diagnostics:
+                log_error("Build diagnostics:")
+                for rendered in rendered_diagnostics:
+                    for diagnostic_line in rendered.strip().split('\n'):
+                        log_error(f"  {diagnostic_line}")
+            else:
+                # No compiler diagnostics means cargo itself failed; its
+                # explanation is on stderr
+                stderr_spill.seek(0)
+                stderr_text = stderr_spill.read().decode(errors="replace").strip()
+                if stderr_text:
+                    log_error("Cargo stderr output:")
+                    for stderr_line in stderr_text.split('\n'):
+                        log_error(f"  {stderr_line}")
             sys.exit(1)
 
-        if not out_dir:
-            log_error(f"Failed to find build script output directory for package {current_package_id}")
-            log_error("This usually means the package has no build.rs or the build failed")
-            sys.exit(1)
+    if not plugin_exe:
+        log_error(f"Failed to find executable path for {crate_binary}")
+        sys.exit(1)
 
-        # Construct path to entry.tp
-        out_dir_parent = Path(out_dir).parent
-        entry_tp = out_dir_parent / "out" / "entry.tp"
+    if not out_dir:
+        log_error(f"Failed to find build script output directory for package {current_package_id}")
+        log_error("This usually means the package has no build.rs or the build failed")
+        sys.exit(1)
 
-        if not entry_tp.exists():
-            log_error(f"entry.tp not found at {entry_tp}")
-            log_error("This usually means the build script failed to generate the TouchPortal plugin definition")
-            sys.exit(1)
+    # Construct path to entry.tp
+    out_dir_parent = Path(out_dir).parent
+    entry_tp = out_dir_parent / "out" / "entry.tp"
 
-        log_info(f"Built: {plugin_exe}")
-        log_info(f"Entry: {entry_tp}")
+    if not entry_tp.exists():
+        log_error(f"entry.tp not found at {entry_tp}")
+        log_error("This usually means the build script failed to generate the TouchPortal plugin definition")
+        sys.exit(1)
 
-        return str(plugin_exe), str(entry_tp)
+    log_info(f"Built: {plugin_exe}")
+    log_info(f"Entry: {entry_tp}")
 
-    except subprocess.CalledProcessError as e:
-        log_error(f"Failed to build plugin: {e}")
-        if e.stderr:
-            log_error("Build stderr output:")
-            for line in e.stderr.strip().split('\n'):
-                log_error(f"  {line}")
-        sys.exit(1)
+    return str(plugin_exe), str(entry_tp)
 
 
 def validate_plugin_start_cmd(cmd_name: str, cmd_value: Optional[str], is_os_specific: bool,
@@ -176,8 +228,7 @@ def validate_plugin_start_cmd(cmd_name: str, cmd_value: Optional[str], is_os_spe
     cmd_path = cmd_value.split(' ', 1)[0]
 
     # Validate the directory structure: should start with %TP_PLUGIN_FOLDER% followed by plugin name
-    pattern = r"^%TP_PLUGIN_FOLDER%([^/]+)/(.+)$"
-    match = re.match(pattern, cmd_path)
+    match = _START_CMD_RE.match(cmd_path)
 
     if not match:
         log_error(f"{cmd_name} has invalid format: {cmd_value}")
@@ -227,6 +278,49 @@ def validate_plugin_start_cmd(cmd_name: str, cmd_value: Optional[str], is_os_spe
     return True
 
 
+_START_CMD_KEYS = (
+    "plugin_start_cmd",
+    "plugin_start_cmd_windows",
+    "plugin_start_cmd_mac",
+    "plugin_start_cmd_linux",
+)
+
+
+def read_start_cmds(entry_tp_path: str) -> Dict[str, Optional[str]]:
+    """
+    Read the plugin_start_cmd* values from entry.tp.
+
+    Validation only needs these four top-level keys, so when ijson is
+    available this streams the file and stops as soon as all of them have
+    been seen, instead of building a dict of the entire plugin definition.
+
+    Args:
+        entry_tp_path: Path to the entry.tp file
+
+    Returns:
+        Mapping of command key to value (None for absent keys)
+
+    Raises:
+        ValueError: If entry.tp is not valid JSON
+    """
+    if ijson is None:
+        entry_data = json_loads(Path(entry_tp_path).read_bytes())
+        return {key: entry_data.get(key) for key in _START_CMD_KEYS}
+
+    found: Dict[str, Optional[str]] = {}
+    with open(entry_tp_path, 'rb') as f:
+        try:
+            for prefix, event, value in ijson.parse(f):
+                if prefix in _START_CMD_KEYS and event in ("string", "null"):
+                    found[prefix] = value
+                    if len(found) == len(_START_CMD_KEYS):
+                        break
+        except ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+
+    return {key: found.get(key) for key in _START_CMD_KEYS}
+
+
 def validate_entry_tp(entry_tp_path: str, plugin_name: str, plugin_exe: str) -> None:
     """
     Validate that the plugin_start_cmd in entry.tp matches our build configuration.
@@ -242,30 +336,17 @@ def validate_entry_tp(entry_tp_path: str, plugin_name: str, plugin_exe: str) ->
     log_step("Validating plugin_start_cmd consistency")
 
     try:
-        with open(entry_tp_path, 'r') as f:
-            entry_data = json.load(f)
-
-        # Extract and validate all plugin start command variants
-        plugin_start_cmd = entry_data.get("plugin_start_cmd")
-        plugin_start_cmd_windows = entry_data.get("plugin_start_cmd_windows", "")
-        plugin_start_cmd_mac = entry_data.get("plugin_start_cmd_mac", "")
-        plugin_start_cmd_linux = entry_data.get("plugin_start_cmd_linux", "")
+        start_cmds = read_start_cmds(entry_tp_path)
 
         # The main plugin_start_cmd is required
-        if not plugin_start_cmd:
+        if not start_cmds["plugin_start_cmd"]:
             log_error("plugin_start_cmd not found in entry.tp")
             sys.exit(1)
 
         # Validate all present plugin start commands
-        validations = [
-            ("plugin_start_cmd", plugin_start_cmd, False),
-            ("plugin_start_cmd_windows", plugin_start_cmd_windows, True),
-            ("plugin_start_cmd_mac", plugin_start_cmd_mac, True),
-            ("plugin_start_cmd_linux", plugin_start_cmd_linux, True),
-        ]
-
-        for cmd_name, cmd_value, is_os_specific in validations:
-            if not validate_plugin_start_cmd(cmd_name, cmd_value, is_os_specific, plugin_name, plugin_exe):
+        for cmd_name in _START_CMD_KEYS:
+            is_os_specific = cmd_name != "plugin_start_cmd"
+            if not validate_plugin_start_cmd(cmd_name, start_cmds[cmd_name], is_os_specific, plugin_name, plugin_exe):
                 sys.exit(1)
 
         log_info("All plugin_start_cmd validations passed")
@@ -274,7 +355,7 @@ def validate_entry_tp(entry_tp_path: str, plugin_name: str, plugin_exe: str) ->
         log_error(f"Failed to read entry.tp: {e}")
         log_error("This usually means the build script failed to generate entry.tp")
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         log_error(f"Failed to parse entry.tp JSON: {e}")
         log_error("The entry.tp file appears to be corrupted or malformed")
         sys.exit(1)
@@ -292,23 +373,23 @@ def create_tpp_package(plugin_name: str, plugin_exe: str, entry_tp: str, tpp_fil
     """
     log_step(f"Creating .tpp package: {tpp_file}")
 
-    # Create a temporary directory for staging the plugin files
-    with tempfile.TemporaryDirectory() as temp_dir:
-        plugin_dir = Path(temp_dir) / plugin_name
-        plugin_dir.mkdir(parents=True)
-
-        # Copy the essential files: the binary and the plugin definition
-        shutil.copy2(plugin_exe, plugin_dir)
-        shutil.copy2(entry_tp, plugin_dir)
-
-        # Create the ZIP package
-        tpp_path = Path(tpp_file)
-        with zipfile.ZipFile(tpp_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in plugin_dir.rglob('*'):
-                if file_path.is_file():
-                    # Calculate the archive path relative to temp_dir
-                    arcname = file_path.relative_to(temp_dir)
-                    zipf.write(file_path, arcname)
+    # Level 1 DEFLATE compresses a release binary almost as well as the
+    # default level 6 but several times faster; TPP_ZIP_LEVEL overrides
+    # it for anyone who wants smaller archives for distribution
+    try:
+        compress_level = int(os.environ.get("TPP_ZIP_LEVEL", "1"))
+    except ValueError:
+        compress_level = 1
+
+    # Write the two files straight into the archive under the plugin
+    # directory; staging a copy on disk first just rewrites the (large)
+    # binary an extra time. A large write buffer batches zipfile's many
+    # small record and central-directory writes into few syscalls.
+    with open(tpp_file, 'wb', buffering=1024 * 1024) as fp:
+        with zipfile.ZipFile(fp, 'w', zipfile.ZIP_DEFLATED,
+                             compresslevel=compress_level) as zipf:
+            zipf.write(plugin_exe, f"{plugin_name}/{Path(plugin_exe).name}")
+            zipf.write(entry_tp, f"{plugin_name}/{Path(entry_tp).name}")
 
     log_info(f"Created: {tpp_file}")
 
@@ -330,7 +411,7 @@ Only rebuilds if source files have changed since the last build.""",
 
     # First, we extract the plugin configuration from Cargo.toml metadata.
     # This gives us the plugin name, binary name, and output .tpp filename.
-    plugin_name, crate_binary, tpp_file = get_plugin_config()
+    plugin_name, crate_binary, tpp_file, package_id = get_plugin_config()
 
     # Verify all required tools are available before we start building.
     # This prevents partial builds when dependencies are missing.
@@ -344,16 +425,21 @@ Only rebuilds if source files have changed since the last build.""",
     # We only rebuild if source files are newer than the existing package.
     log_step("Checking if rebuild is needed")
 
-    source_time = get_newest_source_time()
     tpp_path = Path(tpp_file)
     package_time = get_file_mtime(tpp_path)
 
-    if source_time <= package_time:
+    if not is_any_source_newer(package_time):
+        # Refresh the package's mtime so mtime-based consumers (make, CI
+        # caches) see it as checked now rather than as stale
+        try:
+            os.utime(tpp_path, None)
+        except OSError:
+            pass
         log_step(f"Package up to date: {tpp_file}")
         return
 
     # If we reach here, we need to build the plugin.
-    plugin_exe, entry_tp = build_plugin(crate_binary)
+    plugin_exe, entry_tp = build_plugin(crate_binary, package_id)
 
     # Validate that the plugin_start_cmd in entry.tp matches our build configuration.
     # This ensures TouchPortal will be able to find and execute the plugin correctly.
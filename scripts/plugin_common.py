@@ -4,6 +4,7 @@ Common functions for TouchPortal plugin packaging and installation.
 Import this module from plugin package.py and install.py scripts.
 """
 
+import hashlib
 import json
 import shutil
 import subprocess
@@ -11,6 +12,13 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+try:
+    # orjson decodes cargo's JSON streams several times faster than the
+    # stdlib; fall back when it isn't installed
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 try:
     import colorama
     from colorama import Fore, Style
@@ -26,44 +34,91 @@ except ImportError:
         RESET_ALL = ""
 
 
-def get_plugin_config() -> Tuple[str, str, str]:
+def _config_cache_path() -> Path:
+    """
+    Path of the short-lived plugin config cache for the current crate.
+
+    Lives under the user's cache directory rather than a world-writable
+    temp dir: the cached plugin name feeds install paths under $HOME, so
+    other local users must not be able to pre-seed it.
+    """
+    cwd_digest = hashlib.sha256(str(Path.cwd().resolve()).encode()).hexdigest()[:16]
+    return Path.home() / ".cache" / "touchportal-plugin" / f"config_{cwd_digest}.json"
+
+
+def _cargo_toml_mtime_ns() -> Optional[int]:
+    """Modification time of the crate's Cargo.toml, or None if unreadable."""
+    try:
+        return Path("Cargo.toml").stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_plugin_config() -> Tuple[str, str, str, str]:
     """
     Get plugin configuration from cargo metadata.
 
+    The result is cached in a temp file keyed on Cargo.toml's mtime, so the
+    usual install.py -> package.py sequence only pays for one cargo metadata
+    resolver pass instead of one per script.
+
     Returns:
-        Tuple of (plugin_name, crate_binary, tpp_file)
+        Tuple of (plugin_name, crate_binary, tpp_file, package_id)
 
     Raises:
         SystemExit: If plugin configuration cannot be found
     """
+    cache_path = _config_cache_path()
+    manifest_mtime = _cargo_toml_mtime_ns()
+
+    if manifest_mtime is not None:
+        try:
+            cached = json.loads(cache_path.read_text())
+            config = cached["config"]
+            if cached.get("cargo_toml_mtime_ns") == manifest_mtime and len(config) == 4:
+                return tuple(config)
+        except (OSError, ValueError, KeyError):
+            pass  # Missing or stale cache; fall through to cargo
+
     try:
-        # Get current package metadata
+        # Get current package metadata. The JSON decoders accept bytes, so
+        # leaving the stream undecoded skips a UTF-8 pass over what can be a
+        # sizeable document.
         metadata_result = subprocess.run(
             ["cargo", "metadata", "--format-version=1", "--no-deps"],
             capture_output=True,
-            text=True,
             check=True,
         )
-        metadata = json.loads(metadata_result.stdout)
-
-        # Get the current package ID using cargo pkgid
-        pkgid_result = subprocess.run(
-            ["cargo", "pkgid"],
-            capture_output=True,
-            text=True,
-            check=True,
+        metadata = json_loads(metadata_result.stdout)
+
+        # The current package is the one whose manifest is the local
+        # Cargo.toml; resolving it from the metadata we already have avoids
+        # spawning a second cargo process just to ask for the package id
+        manifest_path = str(Path("Cargo.toml").resolve())
+        current_package = next(
+            (package for package in metadata["packages"]
+             if package["manifest_path"] == manifest_path),
+            None,
         )
-        current_package_id = pkgid_result.stdout.strip()
 
-        # Get the current package by matching the ID
-        current_package = None
-        for package in metadata["packages"]:
-            if package["id"] == current_package_id:
-                current_package = package
-                break
+        if current_package is None:
+            # Rare (e.g. a virtual manifest); fall back to asking cargo
+            pkgid_result = subprocess.run(
+                ["cargo", "pkgid"],
+                capture_output=True,
+                check=True,
+            )
+            current_package_id = pkgid_result.stdout.decode().strip()
+            current_package = next(
+                (package for package in metadata["packages"]
+                 if package["id"] == current_package_id),
+                None,
+            )
+        else:
+            current_package_id = current_package["id"]
 
         if not current_package:
-            log_error(f"Could not find package with ID {current_package_id}")
+            log_error(f"Could not find package for manifest {manifest_path}")
             log_error("This usually means the current directory is not a valid Rust crate")
             sys.exit(1)
 
@@ -88,17 +143,27 @@ def get_plugin_config() -> Tuple[str, str, str]:
         # Derive tpp filename
         tpp_file = f"{plugin_name}.tpp"
 
-        return plugin_name, crate_binary, tpp_file
+        if manifest_mtime is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_text(json.dumps({
+                    "cargo_toml_mtime_ns": manifest_mtime,
+                    "config": [plugin_name, crate_binary, tpp_file, current_package_id],
+                }))
+            except OSError:
+                pass  # Caching is best-effort
+
+        return plugin_name, crate_binary, tpp_file, current_package_id
 
     except subprocess.CalledProcessError as e:
         log_error(f"Failed to get cargo metadata: {e}")
         if e.stderr:
             log_error("Cargo stderr output:")
-            for line in e.stderr.strip().split('\n'):
+            for line in e.stderr.decode(errors="replace").strip().split('\n'):
                 log_error(f"  {line}")
         log_error("Please ensure you're in a valid Rust crate directory with Cargo.toml")
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         log_error(f"Failed to parse cargo metadata JSON: {e}")
         log_error("This usually indicates a problem with the cargo installation")
         sys.exit(1)